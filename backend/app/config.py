@@ -1,7 +1,10 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Literal
 import os
 
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 class Settings(BaseSettings):
     # MongoDB settings
     mongodb_url: str = "mongodb://localhost:27017/"
@@ -18,6 +21,21 @@ class Settings(BaseSettings):
     # Upload settings
     upload_folder: str = "uploads"
     max_upload_size: int = 5_242_880  # 5MB in bytes
+
+    # Note write batching (group commit for note sends)
+    note_batching: bool = False
+    note_batch_window_ms: int = 5
+    note_batch_max_size: int = 500
+    note_batch_queue_size: int = 5000
+
+    # Public profile lookups
+    user_batch_max_ids: int = 100
+    profile_cache_ttl: int = 30  # seconds
+
+    # Note content moderation
+    moderation_words_file: str = os.path.join(BACKEND_DIR, "moderation_words.txt")
+    moderation_mode: Literal["block", "flag"] = "block"  # "block" rejects the note, "flag" stores it flagged
+    moderation_reload_interval: int = 10  # seconds between word list change checks
     
     class Config:
         env_file = ".env"
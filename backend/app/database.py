@@ -1,14 +1,20 @@
 from motor.motor_asyncio import AsyncIOMotorClient
 from contextlib import asynccontextmanager
+from .note_batcher import NoteBatcher
+from .nicknames import NicknameIndex
+from .moderation import ContentFilter
 
 # Global variables for database connections
 mongodb_client = None
 mongodb = None
+note_batcher = None
+nickname_index = NicknameIndex()
+content_filter = None
 
 @asynccontextmanager
 async def lifespan(app):
     # Startup
-    global mongodb_client, mongodb
+    global mongodb_client, mongodb, note_batcher, content_filter
     from .config import get_settings
     settings = get_settings()
     mongodb_client = AsyncIOMotorClient(settings.mongodb_url)
@@ -19,11 +25,45 @@ async def lifespan(app):
     await mongodb.notes.create_index("receiver_id")
     await mongodb.notes.create_index("sender_id")
     
+    # Warm nickname availability lookups
+    await nickname_index.load(mongodb.users)
+    
+    # Compile the note content filter once, shared by all requests
+    content_filter = ContentFilter(
+        settings.moderation_words_file,
+        reload_interval=settings.moderation_reload_interval
+    )
+    content_filter.load()
+    content_filter.start()
+    
+    if settings.note_batching:
+        note_batcher = NoteBatcher(
+            mongodb.notes,
+            window_ms=settings.note_batch_window_ms,
+            max_batch_size=settings.note_batch_max_size,
+            max_queue_size=settings.note_batch_queue_size
+        )
+        note_batcher.start()
+    
     yield
     
     # Shutdown
+    await content_filter.close()
+    if note_batcher:
+        # Flush queued notes before the connection goes away
+        await note_batcher.close()
+        note_batcher = None
     if mongodb_client:
         mongodb_client.close()
 
 def get_db():
     return mongodb
+
+def get_note_batcher():
+    return note_batcher
+
+def get_nickname_index():
+    return nickname_index
+
+def get_content_filter():
+    return content_filter
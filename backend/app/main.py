@@ -31,6 +31,7 @@ async def phase_check_middleware(request: Request, call_next):
     allowed_endpoints = [
         "/api/auth/login",
         "/api/auth/register",
+        "/api/auth/nickname/available",
         "/api/system/phase",
         "/docs",
         "/openapi.json"
@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import os
+from collections import deque
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def normalize(text: str) -> str:
+    return text.lower().replace("ё", "е")
+
+
+def compile_terms(terms: list[str]) -> tuple:
+    """Build the Aho-Corasick automaton for a list of terms in word list syntax"""
+    goto = [{}]
+    outputs = [[]]
+    patterns = []
+    for term in terms:
+        term = term.strip()
+        left_open = term.startswith("*")
+        right_open = term.endswith("*")
+        word = normalize(term.strip("*"))
+        if not word:
+            continue
+
+        state = 0
+        for ch in word:
+            if ch not in goto[state]:
+                goto.append({})
+                outputs.append([])
+                goto[state][ch] = len(goto) - 1
+            state = goto[state][ch]
+        outputs[state].append(len(patterns))
+        patterns.append((term, len(word), left_open, right_open))
+
+    # Breadth-first pass for failure links, merging outputs along them
+    fail = [0] * len(goto)
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for ch, child in goto[state].items():
+            queue.append(child)
+            target = fail[state]
+            while target and ch not in goto[target]:
+                target = fail[target]
+            fail[child] = goto[target].get(ch, 0)
+            outputs[child] = outputs[child] + outputs[fail[child]]
+
+    return goto, fail, outputs, patterns
+
+
+class ContentFilter:
+    """
+    Multi-pattern matcher for note content built on an Aho-Corasick automaton,
+    so a note is checked against the whole word list in one pass.
+
+    The word list has one term per line; empty lines and lines starting with
+    '#' are skipped. Terms match whole words by default. A '*' at the end
+    matches any ending (`дурак*` covers `дураки`, `дураку`), a '*' at the
+    start any beginning, so `*http*` catches links inside other text.
+    Matching is case-insensitive and treats 'ё' as 'е'.
+
+    A background task started with start() checks the file every
+    `reload_interval` seconds. A changed file is loaded once its mtime has
+    stayed the same for a full interval, so a write in progress is not
+    picked up; replacing the file with a rename is still the safest way to
+    edit it. The new automaton is built in a worker thread and swapped in
+    only when complete. If the file is missing or cannot be read, the
+    previous word list stays in effect and the failure is logged.
+    """
+
+    def __init__(self, words_file: Optional[str] = None, reload_interval: float = 10):
+        self.words_file = words_file
+        self.reload_interval = reload_interval
+        self._mtime = None
+        self._seen_mtime = None
+        self._missing = False
+        self._task: Optional[asyncio.Task] = None
+        self.build([])
+
+    def build(self, terms: list[str]):
+        """Compile the automaton for a list of terms and install it"""
+        self._automaton = compile_terms(terms)
+
+    def _stat(self) -> Optional[float]:
+        try:
+            mtime = os.stat(self.words_file).st_mtime
+        except (OSError, TypeError):
+            if not self._missing:
+                logger.warning("Moderation word list %s not found, keeping current list",
+                               self.words_file)
+            self._missing = True
+            return None
+        self._missing = False
+        return mtime
+
+    def _read(self) -> tuple:
+        with open(self.words_file, encoding="utf-8") as f:
+            terms = [line for line in map(str.strip, f) if line and not line.startswith("#")]
+        return compile_terms(terms), len(terms)
+
+    def load(self):
+        """Read the word list file and build the automaton, at startup"""
+        try:
+            mtime = os.stat(self.words_file).st_mtime
+        except (OSError, TypeError):
+            self._missing = True
+            logger.warning("Moderation word list %s not found, note moderation is disabled "
+                           "until it is created", self.words_file)
+            return
+        try:
+            self._automaton, count = self._read()
+        except (OSError, ValueError) as e:
+            logger.error("Could not load moderation word list %s: %s", self.words_file, e)
+            return
+        self._mtime = self._seen_mtime = mtime
+        logger.info("Loaded %d moderation terms from %s", count, self.words_file)
+
+    async def reload_if_changed(self):
+        mtime = self._stat()
+        if mtime is None or mtime == self._mtime:
+            return
+        if mtime != self._seen_mtime:
+            # Wait one more interval in case the file is still being written
+            self._seen_mtime = mtime
+            return
+        try:
+            automaton, count = await asyncio.to_thread(self._read)
+        except (OSError, ValueError) as e:
+            # UnicodeDecodeError is a ValueError; retried on the next change
+            logger.error("Could not reload moderation word list %s, keeping current list: %s",
+                         self.words_file, e)
+            self._mtime = mtime
+            return
+        self._automaton = automaton
+        self._mtime = mtime
+        logger.info("Reloaded %d moderation terms from %s", count, self.words_file)
+
+    def start(self):
+        self._task = asyncio.create_task(self._watch())
+
+    async def close(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                await self.reload_if_changed()
+            except Exception:
+                logger.exception("Moderation word list check failed")
+
+    def matches(self, text: str) -> list[str]:
+        """Return the word list terms found in text, in order of appearance"""
+        text = normalize(text)
+        goto, fail, outputs, patterns = self._automaton
+        found = []
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index in outputs[state]:
+                term, length, left_open, right_open = patterns[index]
+                start = i - length + 1
+                if not left_open and start > 0 and text[start - 1].isalnum():
+                    continue
+                if not right_open and i + 1 < len(text) and text[i + 1].isalnum():
+                    continue
+                if term not in found:
+                    found.append(term)
+        return found
@@ -0,0 +1,24 @@
+class NicknameIndex:
+    """
+    In-memory set of registered nicknames, warmed at startup and updated
+    on every successful registration in this process.
+
+    Nicknames are never deleted, so a hit means the nickname is taken.
+    A miss is only a hint: another worker may have registered it since
+    startup. Registration itself relies on the unique index.
+    """
+
+    def __init__(self):
+        self._nicknames = set()
+
+    async def load(self, collection):
+        self._nicknames = {
+            user["nickname"]
+            async for user in collection.find({}, {"_id": 0, "nickname": 1})
+        }
+
+    def add(self, nickname: str):
+        self._nicknames.add(nickname)
+
+    def __contains__(self, nickname: str) -> bool:
+        return nickname in self._nicknames
@@ -0,0 +1,101 @@
+import asyncio
+from typing import Optional
+from pymongo.errors import BulkWriteError
+
+
+class NoteBatcher:
+    """
+    Write-behind queue that groups note inserts into a single insert_many.
+
+    Durability guarantees:
+    - A caller gets its note id only after the batch containing the note
+      has been acknowledged by MongoDB. Nothing is reported as sent before
+      it is written.
+    - A note rejected by MongoDB fails only its own caller. A write concern
+      error fails every caller in the batch, since none of those writes
+      were confirmed.
+    - Any other error (e.g. a dropped connection) fails every caller in the
+      batch, but with an unordered insert_many some of those notes may
+      already be stored. A caller that retries after such an error may
+      therefore create a duplicate note.
+    - close() stops accepting new notes and flushes everything already
+      queued, so a clean shutdown loses nothing. A crash of the process
+      loses only notes whose callers have not yet received an id.
+    - A note whose caller disconnects after submit() is still written.
+
+    Backpressure: at most `max_queue_size` notes may wait for a flush;
+    beyond that submit() raises asyncio.QueueFull.
+    """
+
+    def __init__(self, collection, window_ms: int = 5, max_batch_size: int = 500,
+                 max_queue_size: int = 5000):
+        self.collection = collection
+        self.window = window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def submit(self, note: dict):
+        """Queue a note document and wait until it is written. Returns its _id."""
+        if self._closed:
+            raise RuntimeError("Note batcher is closed")
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((note, future))
+        return await future
+
+    async def close(self):
+        """Stop accepting notes and flush the ones already queued."""
+        self._closed = True
+        if self._task:
+            # The sentinel goes behind every accepted note, so all of them are flushed
+            await self._queue.put(None)
+            await self._task
+            self._task = None
+
+    async def _run(self):
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            # Collect for a short window unless a full batch is already waiting
+            if self._queue.qsize() < self.max_batch_size - 1:
+                await asyncio.sleep(self.window)
+            stopping = False
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._flush(batch)
+            if stopping:
+                return
+
+    async def _flush(self, batch):
+        notes = [note for note, _ in batch]
+        errors = {}
+        try:
+            # insert_many assigns _id to each document before sending
+            await self.collection.insert_many(notes, ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get("writeErrors", []):
+                errors[error["index"]] = BulkWriteError({"writeErrors": [error]})
+            if e.details.get("writeConcernErrors"):
+                # Inserted but not acknowledged with the required write concern
+                for index in range(len(batch)):
+                    errors.setdefault(index, e)
+        except Exception as e:
+            errors = {index: e for index in range(len(batch))}
+
+        for index, (note, future) in enumerate(batch):
+            if future.done():
+                continue
+            if index in errors:
+                future.set_exception(errors[index])
+            else:
+                future.set_result(note["_id"])
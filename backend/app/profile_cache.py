@@ -0,0 +1,49 @@
+import time
+from collections import OrderedDict
+from typing import Optional
+
+
+class ProfileCache:
+    """
+    Short-lived in-process cache of public user profiles keyed by user id.
+
+    Entries expire after `ttl` seconds; the owner's photo update drops the
+    entry right away. Other workers may serve a stale profile until expiry.
+    """
+
+    def __init__(self, ttl: float = 30, max_size: int = 10000):
+        self.ttl = ttl
+        self.max_size = max_size
+        # Insertion order is expiry order since every entry gets the same ttl
+        self._entries = OrderedDict()
+
+    def get(self, user_id: str) -> Optional[dict]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires, profile = entry
+        if expires < time.monotonic():
+            del self._entries[user_id]
+            return None
+        return profile
+
+    def set(self, user_id: str, profile: dict):
+        self._entries.pop(user_id, None)
+        if len(self._entries) >= self.max_size:
+            self._evict()
+        self._entries[user_id] = (time.monotonic() + self.ttl, profile)
+
+    def invalidate(self, user_id: str):
+        self._entries.pop(user_id, None)
+
+    def _evict(self):
+        # Expired entries sit at the front, so stop at the first live one
+        now = time.monotonic()
+        while self._entries:
+            expires, _ = next(iter(self._entries.values()))
+            if expires >= now:
+                break
+            self._entries.popitem(last=False)
+        if len(self._entries) >= self.max_size:
+            # Drop the oldest insertion
+            self._entries.popitem(last=False)
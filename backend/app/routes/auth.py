@@ -2,8 +2,9 @@ from fastapi import APIRouter, HTTPException, Depends, Body, Form, Request
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from ..models import UserCreate, UserInDB, LoginResponse, UserResponse, UserLogin
 from ..config import get_settings
-from ..database import get_db
+from ..database import get_db, get_nickname_index
 from passlib.context import CryptContext
+from pymongo.errors import DuplicateKeyError
 from datetime import datetime, timedelta
 import jwt
 import re
@@ -47,10 +48,18 @@ def validate_password(password: str) -> bool:
         return False
     return True
 
+@router.get("/nickname/available")
+async def nickname_available(nickname: str):
+    # Served from memory; registration still enforces uniqueness
+    return {
+        "nickname": nickname,
+        "available": nickname not in get_nickname_index()
+    }
+
 @router.post("/register", response_model=UserResponse)
 async def register(user: UserCreate, db: AsyncIOMotorDatabase = Depends(get_db)):
-    # Check if user exists
-    if await db.users.find_one({"nickname": user.nickname}):
+    # Known nicknames are rejected without hashing or a database round trip
+    if user.nickname in get_nickname_index():
         raise HTTPException(status_code=400, detail="Nickname already registered")
     
     # Validate password strength
@@ -66,26 +75,26 @@ async def register(user: UserCreate, db: AsyncIOMotorDatabase = Depends(get_db))
     user_dict["created_at"] = datetime.utcnow()
     
     try:
-        # Insert into database
+        # Insert into database, the unique index rejects taken nicknames
         result = await db.users.insert_one(user_dict)
-        
-        # Get created user
-        created_user = await db.users.find_one({"_id": result.inserted_id})
-        if not created_user:
-            raise HTTPException(status_code=500, detail="Failed to create user")
-        
-        # Generate token
-        token = create_access_token(str(result.inserted_id))
-        
-        # Return response
-        return {
-            "id": str(result.inserted_id),
-            "nickname": created_user["nickname"],
-            "photo_url": created_user.get("photo_url"),
-            "token": token
-        }
+    except DuplicateKeyError:
+        get_nickname_index().add(user.nickname)
+        raise HTTPException(status_code=400, detail="Nickname already registered")
     except Exception as e:
         raise HTTPException(status_code=500, detail="Database error")
+    
+    get_nickname_index().add(user.nickname)
+    
+    # Generate token
+    token = create_access_token(str(result.inserted_id))
+    
+    # Return response
+    return {
+        "id": str(result.inserted_id),
+        "nickname": user_dict["nickname"],
+        "photo_url": user_dict.get("photo_url"),
+        "token": token
+    }
 
 @router.post("/login", response_model=LoginResponse)
 async def login(
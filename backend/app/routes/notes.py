@@ -2,10 +2,12 @@ from fastapi import APIRouter, HTTPException, Depends
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from typing import Optional
 from ..models import UserInDB
-from ..database import get_db
+from ..config import get_settings
+from ..database import get_db, get_note_batcher, get_content_filter
 from ..dependencies import get_current_user
 from datetime import datetime
 from bson import ObjectId
+import asyncio
 
 router = APIRouter()
 
@@ -35,6 +37,16 @@ async def create_note(
     if str(current_user.id) == receiver_id:
         raise HTTPException(status_code=400, detail="Cannot send note to yourself")
 
+    # Check content against the moderation word list
+    flagged = False
+    content_filter = get_content_filter()
+    if content_filter:
+        if content_filter.matches(content):
+            if get_settings().moderation_mode == "flag":
+                flagged = True
+            else:
+                raise HTTPException(status_code=400, detail="Note contains forbidden content")
+
     # Create note
     note = {
         "content": content,
@@ -49,17 +61,28 @@ async def create_note(
     if is_anonymous:
         note["anonym_id"] = generate_anonym_id(str(current_user.id), receiver_id)
 
-    result = await db.notes.insert_one(note)
+    # Flagged notes are stored for review but never delivered
+    if flagged:
+        note["flagged"] = True
+
+    note_batcher = get_note_batcher()
+    if note_batcher:
+        try:
+            note["_id"] = await note_batcher.submit(note)
+        except asyncio.QueueFull:
+            raise HTTPException(status_code=429, detail="Too many requests")
+    else:
+        # insert_one sets note["_id"]
+        await db.notes.insert_one(note)
     
-    created_note = await db.notes.find_one({"_id": result.inserted_id})
     return {
-        "id": str(created_note["_id"]),
-        "content": created_note["content"],
-        "sender_id": str(created_note["sender_id"]),
-        "receiver_id": str(created_note["receiver_id"]),
-        "is_anonymous": created_note["is_anonymous"],
-        "anonym_id": created_note.get("anonym_id"),
-        "created_at": created_note["created_at"]
+        "id": str(note["_id"]),
+        "content": note["content"],
+        "sender_id": str(note["sender_id"]),
+        "receiver_id": str(note["receiver_id"]),
+        "is_anonymous": note["is_anonymous"],
+        "anonym_id": note.get("anonym_id"),
+        "created_at": note["created_at"]
     }
 
 @router.get("/sent")
@@ -104,9 +127,11 @@ async def get_received_notes(
     db: AsyncIOMotorDatabase = Depends(get_db)
 ):
     skip = (page - 1) * limit
-    total = await db.notes.count_documents({"receiver_id": current_user.id})
+    # Flagged notes are held back from the mailbox
+    query = {"receiver_id": current_user.id, "flagged": {"$ne": True}}
+    total = await db.notes.count_documents(query)
     
-    cursor = db.notes.find({"receiver_id": current_user.id}) \
+    cursor = db.notes.find(query) \
         .sort("created_at", -1) \
         .skip(skip) \
         .limit(limit)
@@ -146,7 +171,8 @@ async def get_unread_count(
 ):
     count = await db.notes.count_documents({
         "receiver_id": current_user.id,
-        "is_read": False
+        "is_read": False,
+        "flagged": {"$ne": True}
     })
     return {"count": count}
 
@@ -1,11 +1,16 @@
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Request, Response
+from fastapi.responses import JSONResponse
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from typing import Optional
 from ..models import UserInDB
+from ..config import get_settings
 from ..database import get_db
 from ..dependencies import get_current_user
+from ..profile_cache import ProfileCache
 import os
 import aiofiles
+import hashlib
+import json
 from datetime import datetime
 from bson import ObjectId
 
@@ -15,6 +20,71 @@ UPLOAD_DIR = "uploads"
 if not os.path.exists(UPLOAD_DIR):
     os.makedirs(UPLOAD_DIR)
 
+PROFILE_PROJECTION = {"nickname": 1, "photo_url": 1}
+profile_cache = ProfileCache(ttl=get_settings().profile_cache_ttl)
+
+def to_profile(user: dict) -> dict:
+    return {
+        "id": str(user["_id"]),
+        "nickname": user["nickname"],
+        "photo_url": user.get("photo_url")
+    }
+
+def normalize_user_id(user_id: str) -> Optional[str]:
+    """Canonical lowercase hex form of a user id, None if it is not a valid ObjectId"""
+    if not ObjectId.is_valid(user_id):
+        return None
+    return str(ObjectId(user_id))
+
+async def load_profiles(db: AsyncIOMotorDatabase, user_ids: list[str]) -> dict:
+    """
+    Resolve public profiles by normalized id, from the cache first and then
+    with one $in query
+    """
+    profiles = {}
+    missing = []
+    for user_id in user_ids:
+        profile = profile_cache.get(user_id)
+        if profile:
+            profiles[user_id] = profile
+        else:
+            missing.append(ObjectId(user_id))
+    
+    if missing:
+        cursor = db.users.find({"_id": {"$in": missing}}, PROFILE_PROJECTION)
+        async for user in cursor:
+            profile = to_profile(user)
+            profile_cache.set(profile["id"], profile)
+            profiles[profile["id"]] = profile
+    
+    return profiles
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+def cacheable_response(request: Request, content: dict) -> Response:
+    """JSON response with ETag and Cache-Control, 304 if the client copy is current"""
+    body = json.dumps(content, sort_keys=True)
+    etag = f'"{hashlib.sha1(body.encode()).hexdigest()}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={get_settings().profile_cache_ttl}"
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=content, headers=headers)
+
 @router.put("/photo")
 async def update_photo(
     file: UploadFile = File(...),
@@ -44,6 +114,7 @@ async def update_photo(
         {"_id": current_user.id},
         {"$set": {"photo_url": photo_url}}
     )
+    profile_cache.invalidate(str(current_user.id))
     
     return {"photo_url": photo_url}
 
@@ -97,20 +168,40 @@ async def get_profile(
         "created_at": current_user.created_at
     }
 
+@router.get("")
+async def get_users(
+    request: Request,
+    ids: str,
+    db: AsyncIOMotorDatabase = Depends(get_db)
+):
+    requested = [i.strip() for i in ids.split(",") if i.strip()]
+    max_ids = get_settings().user_batch_max_ids
+    if len(requested) > max_ids:
+        raise HTTPException(status_code=400, detail=f"At most {max_ids} ids per request")
+    
+    # Keep request order, drop invalid ids and duplicates
+    normalized = (normalize_user_id(i) for i in requested)
+    user_ids = list(dict.fromkeys(i for i in normalized if i))
+    
+    profiles = await load_profiles(db, user_ids)
+    
+    # Unknown and invalid ids are omitted
+    return cacheable_response(request, {
+        "users": [profiles[i] for i in user_ids if i in profiles]
+    })
+
 @router.get("/{user_id}")
 async def get_user(
     user_id: str,
+    request: Request,
     db: AsyncIOMotorDatabase = Depends(get_db)
 ):
-    try:
-        user = await db.users.find_one({"_id": ObjectId(user_id)})
-        if not user:
-            raise HTTPException(status_code=404, detail="User not found")
-        
-        return {
-            "id": str(user["_id"]),
-            "nickname": user["nickname"],
-            "photo_url": user.get("photo_url")
-        }
-    except:
+    user_id = normalize_user_id(user_id)
+    if not user_id:
         raise HTTPException(status_code=404, detail="User not found")
+    
+    profiles = await load_profiles(db, [user_id])
+    if user_id not in profiles:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    return cacheable_response(request, profiles[user_id])
@@ -0,0 +1,72 @@
+"""
+Compare per-request note inserts with batched inserts under a send spike.
+
+Needs a running MongoDB (MONGODB_URL, default mongodb://localhost:27017/).
+Writes into a scratch `bench_notes` collection that is dropped afterwards.
+
+    cd backend && python -m benchmarks.note_inserts --notes 5000
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.config import get_settings
+from app.note_batcher import NoteBatcher
+
+
+def make_note(i: int) -> dict:
+    return {
+        "content": f"benchmark note {i}",
+        "sender_id": str(ObjectId()),
+        "receiver_id": ObjectId(),
+        "is_anonymous": bool(i % 2),
+        "created_at": datetime.utcnow(),
+        "is_read": False
+    }
+
+
+async def per_request(collection, count: int) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(collection.insert_one(make_note(i)) for i in range(count)))
+    return time.perf_counter() - start
+
+
+async def batched(collection, count: int, window_ms: int, batch_size: int) -> float:
+    batcher = NoteBatcher(collection, window_ms=window_ms, max_batch_size=batch_size,
+                          max_queue_size=count)
+    batcher.start()
+    start = time.perf_counter()
+    await asyncio.gather(*(batcher.submit(make_note(i)) for i in range(count)))
+    elapsed = time.perf_counter() - start
+    await batcher.close()
+    return elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--notes", type=int, default=5000)
+    parser.add_argument("--window-ms", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    client = AsyncIOMotorClient(get_settings().mongodb_url)
+    collection = client.confession.bench_notes
+    try:
+        for name, run in [
+            ("insert_one per request", per_request(collection, args.notes)),
+            ("batched insert_many", batched(collection, args.notes, args.window_ms, args.batch_size)),
+        ]:
+            await collection.drop()
+            elapsed = await run
+            print(f"{name:24} {args.notes} notes in {elapsed:.3f}s "
+                  f"({args.notes / elapsed:,.0f} notes/s)")
+    finally:
+        await collection.drop()
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
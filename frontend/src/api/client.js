@@ -131,6 +131,17 @@ export class ApiClient {
         return response.data;
     }
 
+    /**
+     * Check whether a nickname is still free
+     * @param {string} nickname - Nickname to check
+     * @returns {Promise<{nickname: string, available: boolean}>}
+     */
+    async checkNickname(nickname) {
+        const params = new URLSearchParams({ nickname });
+        const response = await this.client.get(`/auth/nickname/available?${params}`);
+        return response.data;
+    }
+
     /**
      * Login user
      * @param {string} nickname - User nickname
@@ -213,6 +224,19 @@ export class ApiClient {
         return response.data;
     }
 
+    /**
+     * Get several users by ID in one request
+     * @param {string[]} userIds - Users' IDs (unknown IDs are omitted)
+     * @returns {Promise<{
+     *   users: Array<{id: string, nickname: string, photo_url: string|null}>
+     * }>}
+     */
+    async getUsers(userIds) {
+        const params = new URLSearchParams({ ids: userIds.join(',') });
+        const response = await this.client.get(`/users?${params}`);
+        return response.data;
+    }
+
     /**
      * Create a new note
      * @param {string} content - Note content
@@ -1,5 +1,5 @@
 'use client';
-import { useState } from 'react';
+import { useRef, useState } from 'react';
 import { api } from '@/api';
 
 export default function AuthForm() {
@@ -7,6 +7,31 @@ export default function AuthForm() {
     const [error, setError] = useState('');
     const [loading, setLoading] = useState(false);
     const [success, setSuccess] = useState(false);
+    const [nicknameTaken, setNicknameTaken] = useState(false);
+
+    const nicknameCheckTimeout = useRef(null);
+
+    const handleNicknameChange = (e) => {
+        const input = e.target;
+        const nickname = input.value;
+        clearTimeout(nicknameCheckTimeout.current);
+        if (isLogin || nickname.length < 3) {
+            setNicknameTaken(false);
+            return;
+        }
+        // Check once the user pauses typing
+        nicknameCheckTimeout.current = setTimeout(async () => {
+            try {
+                const { available } = await api.checkNickname(nickname);
+                // Ignore answers for a value the user has already changed
+                if (input.value === nickname) {
+                    setNicknameTaken(!available);
+                }
+            } catch (err) {
+                setNicknameTaken(false);
+            }
+        }, 300);
+    };
 
     const validateForm = (nickname, password) => {
         if (!nickname || nickname.length < 3) {
@@ -72,8 +97,14 @@ export default function AuthForm() {
                             id="nickname"
                             name="nickname"
                             required
+                            onChange={handleNicknameChange}
                             className="w-full px-3 py-2 border rounded-md"
                         />
+                        {!isLogin && nicknameTaken && (
+                            <div className="text-red-500 text-sm mt-1">
+                                Nickname already exists
+                            </div>
+                        )}
                     </div>
                     
                     <div>
@@ -111,7 +142,11 @@ export default function AuthForm() {
                 </form>
 
                 <button
-                    onClick={() => setIsLogin(!isLogin)}
+                    onClick={() => {
+                        clearTimeout(nicknameCheckTimeout.current);
+                        setIsLogin(!isLogin);
+                        setNicknameTaken(false);
+                    }}
                     className="w-full mt-4 text-sm text-blue-500 hover:underline"
                 >
                     {isLogin ? 'Need an account? Register' : 'Have an account? Login'}